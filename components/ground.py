@@ -3,6 +3,14 @@ import pygame
 from components.enums import Orientation, ComponentColors
 
 class Ground(Component):
+    # Symbol rotation (degrees) for each orientation, built once at import
+    ROTATIONS = {
+        Orientation.N: 180,
+        Orientation.E: 270,
+        Orientation.S: 0,
+        Orientation.W: 90
+    }
+
     def __init__(self, name: str = "GND", n1: int = 0, x: int = 0, y: int = 0, 
                  orientation: Orientation = Orientation.S, 
                  color: ComponentColors = ComponentColors.BLUE):
@@ -64,15 +72,10 @@ class Ground(Component):
         line_spacing = size / 8.0
         
         # Calculate rotation based on orientation
-        rotation = {
-            Orientation.N: 180,
-            Orientation.E: 270,
-            Orientation.S: 0,
-            Orientation.W: 90
-        }[self.orientation]
+        rotation = self.ROTATIONS[self.orientation]
         
         # Define the ground symbol points relative to center
-        if rotation in [0, 180]:  # Vertical orientation
+        if rotation in (0, 180):  # Vertical orientation
             # Main vertical line
             start_main = (px, py - half_size)
             end_main = (px, py)
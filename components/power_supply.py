@@ -1,7 +1,22 @@
+from functools import lru_cache
 from components.base_component import Component
 import pygame
 from components.enums import Orientation, ComponentColors
 
+
+@lru_cache(maxsize=32)
+def _get_font(size: int):
+    """Return a shared default font of the given size, loading it only once."""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=64)
+def _get_symbol(text: str, size: int, color: tuple):
+    """Return a pre-rendered polarity symbol surface."""
+    return _get_font(size).render(text, True, color)
+
 class PowerSupply(Component):
     def __init__(self, name: str = "", n1: int = 0, n2: int = 0, x: int = 0, y: int = 0, 
                  orientation: Orientation = Orientation.E, 
@@ -77,10 +92,10 @@ class PowerSupply(Component):
         pygame.draw.circle(screen, self.color.value, (px, py), radius, width=2)
         
         # Draw polarity symbols
-        font = pygame.font.Font(None, int(radius))
+        size = int(radius)
         
         # Position symbols based on orientation
-        if self.orientation in [Orientation.E, Orientation.W]:
+        if self.orientation in (Orientation.E, Orientation.W):
             # Horizontal orientation
             plus_pos = (px - radius/2, py - radius/4)
             minus_pos = (px + radius/2 - radius/4, py - radius/4)
@@ -90,7 +105,7 @@ class PowerSupply(Component):
             minus_pos = (px - radius/4, py + radius/2 - radius/4)
             
         # Render the symbols
-        plus_text = font.render("+", True, self.color.value)
-        minus_text = font.render("-", True, self.color.value)
+        plus_text = _get_symbol("+", size, self.color.value)
+        minus_text = _get_symbol("-", size, self.color.value)
         screen.blit(plus_text, plus_pos)
         screen.blit(minus_text, minus_pos)
\ No newline at end of file
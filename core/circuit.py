@@ -5,12 +5,29 @@ class Circuit:
         self.height = height
         self.width = width
         self.components = {}
+        # Spatial index of components by [y][x] for fast neighbor queries
+        self.grid = [[None] * width for _ in range(height)]
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Return True if (x, y) is a valid cell of the circuit grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def component_at(self, x: int, y: int):
+        """Return the component at (x, y), or None if the cell is empty."""
+        if self.in_bounds(x, y):
+            return self.grid[y][x]
+        # Components placed outside the grid only live in the dict
+        return self.components.get((x, y))
 
     def add_component(self, component:Component):
         self.components[(component.x, component.y)] = component
+        if self.in_bounds(component.x, component.y):
+            self.grid[component.y][component.x] = component
 
     def remove_component(self, x:int, y:int):
         del self.components[(x,y)]
+        if self.in_bounds(x, y):
+            self.grid[y][x] = None
 
     def get_adjacent_components(self, x: int, y: int) -> tuple[bool, bool, bool, bool]:
         """Check for components in adjacent positions (up, right, down, left).
@@ -22,9 +39,10 @@ class Circuit:
         Returns:
             Tuple of (up, right, down, left) booleans indicating component presence
         """
+        component_at = self.component_at
         return (
-            isinstance(self.components.get((x, y - 1)), Component),  # up
-            isinstance(self.components.get((x + 1, y)), Component),  # right
-            isinstance(self.components.get((x, y + 1)), Component),  # down
-            isinstance(self.components.get((x - 1, y)), Component)   # left
+            component_at(x, y - 1) is not None,  # up
+            component_at(x + 1, y) is not None,  # right
+            component_at(x, y + 1) is not None,  # down
+            component_at(x - 1, y) is not None   # left
         )
\ No newline at end of file
@@ -115,8 +115,11 @@ class Button:
 
     def set_selected(self, selected: bool) -> None:
         """Set the selected state of the button."""
+        if selected == self.selected:
+            return
+        # Selection only changes the background color, so the cached label
+        # surface stays valid
         self.selected = selected
-        self._render_text()
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the button to a pygame surface."""
@@ -136,8 +139,8 @@ class Button:
         else:
             color = self.colors["normal"]
 
-        # Draw background
-        pygame.draw.rect(surface, color, self.rect)
+        # Draw background (Surface.fill is faster than draw.rect for solid rects)
+        surface.fill(color, self.rect)
         # Draw border
         pygame.draw.rect(surface, (0, 0, 0), self.rect, 2)
         # Draw text
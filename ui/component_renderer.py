@@ -4,14 +4,20 @@ class ComponentRenderer:
         self.circuit = circuit
         self.grid_renderer = grid_renderer
 
-    def draw(self):
-        """Draw all components in the circuit."""
+    def draw(self, surface=None):
+        """Draw all components in the circuit onto surface (defaults to the screen)."""
+        # Nothing to draw on an empty circuit; skip the grid math entirely
+        if not self.circuit.components:
+            return
+
+        grid_to_pixel = self.grid_renderer.grid_to_pixel
+        screen = self.screen if surface is None else surface
         cell_w, cell_h = self.grid_renderer.grid_cell_size()
 
         for comp in self.circuit.components.values():
             try:
-                px, py = self.grid_renderer.grid_to_pixel(comp.x, comp.y)
-                comp.draw(self.screen, px, py, cell_w, cell_h)
+                px, py = grid_to_pixel(comp.x, comp.y)
+                comp.draw(screen, px, py, cell_w, cell_h)
             except (AttributeError, ValueError):
                 # Skip components with invalid coordinates
                 continue
\ No newline at end of file
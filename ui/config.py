@@ -11,6 +11,7 @@ class WindowConfig:
     DEFAULT_HEIGHT = 600
     BORDER = 100
     FPS = 60
+    IDLE_WAIT_MS = 250  # Max time to block waiting for input when idle
     CAPTION = "Circuit Maker"
 
 class ButtonConfig:
@@ -44,4 +45,12 @@ class Tool(Enum):
     WIRE = "WIRE"
     RESISTOR = "RESISTOR"
     POWER_SUPPLY = "POWER_SUPPLY"
-    GROUND = "GROUND"
\ No newline at end of file
+    GROUND = "GROUND"
+
+# Display labels for each tool, built once at import
+TOOL_DISPLAY = {
+    Tool.WIRE: "Wire",
+    Tool.RESISTOR: "Resistor",
+    Tool.POWER_SUPPLY: "Power Supply",
+    Tool.GROUND: "Ground"
+}
@@ -1,5 +1,6 @@
 import pygame
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional
 from ui.config import Tool
 from components.resistor import Resistor
 from components.wire import Wire
@@ -10,6 +11,12 @@ from core.circuit import Circuit
 from components.base_component import Component
 
 class EventHandler:
+    __slots__ = (
+        'circuit', 'current_tool', 'handlers',
+        'on_quit', 'on_grid_click', 'on_component_drag', 'on_circuit_change',
+        'dragging', 'drag_start', 'selected_component', '_last_drag_cell',
+    )
+
     # Map each tool to its corresponding component class
     TOOL_TO_COMPONENT = {
         Tool.WIRE: Wire,
@@ -18,14 +25,18 @@ class EventHandler:
         Tool.GROUND: Ground
     }
 
-    # Default parameters for each component type
+    # Default parameters for each component type (read-only, splatted into constructors)
     COMPONENT_DEFAULTS = {
-        Tool.WIRE: {"name": "W1", "n1": 0, "n2": 1, "orientation": Orientation.E, "color": ComponentColors.RED},
-        Tool.RESISTOR: {"name": "R1", "n1": 0, "n2": 1, "orientation": Orientation.E, "color": ComponentColors.RED, "resistance": 100.0},
-        Tool.POWER_SUPPLY: {"name": "P1", "n1": 0, "n2": 1, "orientation": Orientation.E, "color": ComponentColors.RED, "voltage": 15},
-        Tool.GROUND: {"name": "G1", "n1": 0, "orientation": Orientation.E, "color": ComponentColors.RED}
+        Tool.WIRE: MappingProxyType({"name": "W1", "n1": 0, "n2": 1, "orientation": Orientation.E, "color": ComponentColors.RED}),
+        Tool.RESISTOR: MappingProxyType({"name": "R1", "n1": 0, "n2": 1, "orientation": Orientation.E, "color": ComponentColors.RED, "resistance": 100.0}),
+        Tool.POWER_SUPPLY: MappingProxyType({"name": "P1", "n1": 0, "n2": 1, "orientation": Orientation.E, "color": ComponentColors.RED, "voltage": 15}),
+        Tool.GROUND: MappingProxyType({"name": "G1", "n1": 0, "orientation": Orientation.E, "color": ComponentColors.RED})
     }
 
+    # Neighbor offsets (N, E, S, W) paired with the index of the neighbor's
+    # adjacent_components flag that points back at the origin cell
+    NEIGHBOR_OFFSETS = ((0, -1, 2), (1, 0, 3), (0, 1, 0), (-1, 0, 1))
+
     def __init__(self, circuit: Circuit):
         """Initialize the event handler.
         
@@ -34,23 +45,29 @@ class EventHandler:
         """
         self.circuit = circuit
         self.current_tool = Tool.WIRE
-        self.handlers: Dict[int, Callable] = {
+        handlers: Dict[int, Callable] = {
             pygame.MOUSEBUTTONDOWN: self._handle_mouse_down,
             pygame.MOUSEBUTTONUP: self._handle_mouse_up,
             pygame.MOUSEMOTION: self._handle_mouse_motion,
             pygame.KEYDOWN: self._handle_key_down,
             pygame.QUIT: self._handle_quit
         }
+        # Event types are small ints, so dispatch through a list indexed by type
+        self.handlers: List[Optional[Callable]] = [None] * (max(handlers) + 1)
+        for event_type, handler in handlers.items():
+            self.handlers[event_type] = handler
         
         # Callback functions that can be set by the renderer
         self.on_quit: Optional[Callable] = None
         self.on_grid_click: Optional[Callable] = None
         self.on_component_drag: Optional[Callable] = None
+        self.on_circuit_change: Optional[Callable] = None
         
         # State tracking
         self.dragging = False
         self.drag_start = None
         self.selected_component = None
+        self._last_drag_cell = None
     
     def set_current_tool(self, tool: Tool):
         """Change the current tool."""
@@ -66,7 +83,8 @@ class EventHandler:
         Returns:
             True if the event was handled, False otherwise
         """
-        handler = self.handlers.get(event.type)
+        handlers = self.handlers
+        handler = handlers[event.type] if event.type < len(handlers) else None
         if handler:
             return handler(event, grid_coords)
         return False
@@ -79,6 +97,7 @@ class EventHandler:
         x, y = grid_coords
         self.dragging = True
         self.drag_start = (x, y)
+        self._last_drag_cell = (x, y)
         
         return self._handle_component_placement(x, y, self.current_tool)
     
@@ -89,11 +108,16 @@ class EventHandler:
             
         self.dragging = False
         self.drag_start = None
+        self._last_drag_cell = None
         return True
     
     def _handle_mouse_motion(self, event: pygame.event.Event, grid_coords: Optional[tuple]) -> bool:
         """Handle mouse motion events."""
         if self.dragging and self.on_component_drag and grid_coords:
+            # Only report drags that cross into a different grid cell
+            if grid_coords == self._last_drag_cell:
+                return False
+            self._last_drag_cell = grid_coords
             self.on_component_drag(self.drag_start, grid_coords)
             return True
         return False
@@ -132,14 +156,17 @@ class EventHandler:
 
     def _update_adjacent_wires(self, x: int, y: int):
         """Update the adjacent components property of all neighboring wires."""
-        # Check all adjacent positions (N, E, S, W)
-        positions = [(x, y-1), (x+1, y), (x, y+1), (x-1, y)]
-        
-        # Update each neighboring wire's adjacent_components
-        for nx, ny in positions:
-            neighbor = self.circuit.components.get((nx, ny))
-            if isinstance(neighbor, Wire):
-                neighbor.adjacent_components = self.circuit.get_adjacent_components(nx, ny)
+        component_at = self.circuit.component_at
+        occupied = component_at(x, y) is not None
+
+        # Only the side of each neighboring wire that faces (x, y) can have
+        # changed, so flip that flag instead of re-scanning its neighbors
+        for dx, dy, side in self.NEIGHBOR_OFFSETS:
+            neighbor = component_at(x + dx, y + dy)
+            if type(neighbor) is Wire:
+                adjacent = list(neighbor.adjacent_components)
+                adjacent[side] = occupied
+                neighbor.adjacent_components = tuple(adjacent)
 
     # def _handle_wire_placement(self, x: int, y: int) -> bool:
     #     """Handle placing or removing a wire."""
@@ -202,21 +229,22 @@ class EventHandler:
         if not component_class:
             return False
             
-        # Check if there's already a component of this type at the location
+        # Check if there's already a component of this type at the location.
+        # Component classes are leaves (never subclassed), so exact type checks
+        # are used instead of isinstance; revisit if subclasses are introduced.
         current_component = self.circuit.components.get((x, y))
-        if isinstance(current_component, component_class):
+        if type(current_component) is component_class:
             self.circuit.remove_component(x, y)
             self._update_adjacent_wires(x, y)
         else:
-            params = self.COMPONENT_DEFAULTS.get(tool, {}).copy()
-            params.update({"x": x, "y": y})
+            component = component_class(x=x, y=y, **self.COMPONENT_DEFAULTS[tool])
             
-            component = component_class(**params)
-            
-            if isinstance(component, Wire):
+            if component_class is Wire:
                 component.adjacent_components = self.circuit.get_adjacent_components(x, y)
                 
             self.circuit.add_component(component)
             self._update_adjacent_wires(x, y)
-            
+
+        if self.on_circuit_change:
+            self.on_circuit_change()
         return True
\ No newline at end of file
@@ -1,26 +1,59 @@
 import pygame
-import math
 from .config import Colors, WindowConfig
 
 class GridRenderer:
+    __slots__ = (
+        'screen', 'circuit', 'border',
+        '_cell_cache', '_cell_key', '_inv_cell',
+        '_last_px', '_last_grid',
+        '_grid_surface', '_grid_surface_key',
+    )
+
     def __init__(self, screen, circuit):
         self.screen = screen
         self.circuit = circuit
         self.border = WindowConfig.BORDER
 
+        # Cached (cell_w, cell_h), keyed on screen and circuit dimensions
+        self._cell_cache = None
+        self._cell_key = None
+        self._inv_cell = None
+
+        # Last pixel_to_grid query and its result
+        self._last_px = None
+        self._last_grid = None
+
+        # Cached render of the grid, rebuilt whenever the cell size key changes
+        self._grid_surface = None
+        self._grid_surface_key = None
+
     def grid_cell_size(self):
         """Return (cell_w, cell_h) in pixels for current renderer/circuit sizes."""
-        inner_w = self.screen.get_width() - 2 * self.border
-        inner_h = self.screen.get_height() - 2 * self.border
-        
-        if not hasattr(self.circuit, 'width') or not hasattr(self.circuit, 'height'):
-            raise ValueError("Circuit dimensions unavailable")
-        if self.circuit.width <= 0 or self.circuit.height <= 0:
+        try:
+            key = (self.screen.get_width(), self.screen.get_height(),
+                   self.circuit.width, self.circuit.height)
+        except AttributeError:
+            raise ValueError("Circuit dimensions unavailable") from None
+        if key == self._cell_key:
+            return self._cell_cache
+
+        # Validate only on a cache miss
+        screen_w, screen_h, width, height = key
+        if width <= 0 or height <= 0:
             raise ValueError("Circuit grid dimensions must be > 0")
-            
-        cell_w = inner_w / float(self.circuit.width)
-        cell_h = inner_h / float(self.circuit.height)
-        return cell_w, cell_h
+
+        inner_w = screen_w - 2 * self.border
+        inner_h = screen_h - 2 * self.border
+        cell_w = inner_w / float(width)
+        cell_h = inner_h / float(height)
+        self._cell_cache = (cell_w, cell_h)
+        # Reciprocals let pixel_to_grid multiply instead of divide
+        self._inv_cell = (1.0 / cell_w if cell_w else 0.0,
+                          1.0 / cell_h if cell_h else 0.0)
+        self._cell_key = key
+        # A new cell size invalidates the memoized pixel_to_grid result
+        self._last_px = None
+        return self._cell_cache
 
     def grid_to_pixel(self, x, y):
         """Return pixel center for grid cell (x,y)"""
@@ -31,7 +64,12 @@ class GridRenderer:
 
     def pixel_to_grid(self, px, py):
         """Map pixel coordinates (px,py) into integer grid cell indices (gx,gy)."""
-        cell_w, cell_h = self.grid_cell_size()
+        self.grid_cell_size()
+        # Repeated queries for the same pixel (e.g. bursts of motion events)
+        pos = (px, py)
+        if pos == self._last_px:
+            return self._last_grid
+
         screen_w = self.screen.get_width()
         screen_h = self.screen.get_height()
         
@@ -40,51 +78,65 @@ class GridRenderer:
             py < self.border or py > screen_h - self.border):
             return 0, 0
 
-        gx = int(math.floor((px - self.border) / cell_w))
-        gy = int(math.floor((py - self.border) / cell_h))
-        
-        # Clamp to valid indices
-        gx = max(0, min(self.circuit.width - 1, gx))
-        gy = max(0, min(self.circuit.height - 1, gy))
-        return gx, gy
+        # Offsets are non-negative past the boundary check, so int() == floor()
+        inv_w, inv_h = self._inv_cell
+        gx = int((px - self.border) * inv_w)
+        gy = int((py - self.border) * inv_h)
 
-    def draw(self):
-        """Draw the grid lines."""
-        screen_w = self.screen.get_width()
-        screen_h = self.screen.get_height()
-        inner_w = screen_w - 2 * self.border
-        inner_h = screen_h - 2 * self.border
+        # Clamp to valid indices (only the far edge can overshoot)
+        if gx >= self.circuit.width:
+            gx = self.circuit.width - 1
+        if gy >= self.circuit.height:
+            gy = self.circuit.height - 1
 
-        try:
-            divisions_x = float(self.circuit.width)
-            divisions_y = float(self.circuit.height)
-            if divisions_x <= 0 or divisions_y <= 0:
-                return
-        except (AttributeError, ValueError):
-            return
+        self._last_px = pos
+        self._last_grid = (gx, gy)
+        return self._last_grid
 
-        spacing_x = inner_w / divisions_x
-        spacing_y = inner_h / divisions_y
+    def _build_grid_surface(self):
+        """Render the grid lines once into an off-screen transparent surface."""
+        screen_w = self.screen.get_width()
+        screen_h = self.screen.get_height()
+        spacing_x, spacing_y = self._cell_cache
 
         left = float(self.border)
         top = float(self.border)
         right = float(screen_w - self.border)
         bottom = float(screen_h - self.border)
+        top_i, bottom_i = int(top), int(bottom)
+        left_i, right_i = int(left), int(right)
+
+        surface = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA)
 
         # Draw vertical lines
-        for i in range(int(divisions_x) + 1):
+        for i in range(int(self.circuit.width) + 1):
             x = left + i * spacing_x
             if x > right:
                 break
             px = int(round(x))
-            pygame.draw.line(self.screen, Colors.LIGHT_GRAY, 
-                           (px, int(top)), (px, int(bottom)))
+            pygame.draw.line(surface, Colors.LIGHT_GRAY, (px, top_i), (px, bottom_i))
 
         # Draw horizontal lines
-        for i in range(int(divisions_y) + 1):
+        for i in range(int(self.circuit.height) + 1):
             y = top + i * spacing_y
             if y > bottom:
                 break
             py = int(round(y))
-            pygame.draw.line(self.screen, Colors.LIGHT_GRAY,
-                           (int(left), py), (int(right), py))
\ No newline at end of file
+            pygame.draw.line(surface, Colors.LIGHT_GRAY, (left_i, py), (right_i, py))
+
+        self._grid_surface = surface
+        self._grid_surface_key = self._cell_key
+
+    def draw(self, surface=None):
+        """Draw the grid lines onto surface (defaults to the screen)."""
+        try:
+            self.grid_cell_size()
+        except (AttributeError, ValueError, TypeError):
+            return
+
+        # The grid only changes with the cell size, so blit the cached render
+        if self._grid_surface_key != self._cell_key:
+            self._build_grid_surface()
+
+        target = self.screen if surface is None else surface
+        target.blit(self._grid_surface, (0, 0))
@@ -1,13 +1,20 @@
-
+import logging
+from functools import partial
 import pygame
-import math
 from ui.button import Button
-from ui.config import Colors, WindowConfig, ButtonConfig, Tool
+from ui.config import Colors, WindowConfig, ButtonConfig, Tool, TOOL_DISPLAY
 from ui.grid_renderer import GridRenderer
 from ui.component_renderer import ComponentRenderer
 from ui.event_handler import EventHandler
-from components.resistor import Resistor
-from components.enums import Orientation, ComponentColors
+
+logger = logging.getLogger(__name__)
+
+# Event types that carry a mouse position, and the subset buttons react to
+_MOUSE_EVENT_TYPES = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION))
+_UI_EVENT_TYPES = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+# Window events after which the whole window must be repainted
+_REPAINT_EVENT_TYPES = frozenset((pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                  pygame.WINDOWSHOWN, pygame.WINDOWRESTORED))
 
 class Renderer:
     def __init__(self, circuit, width=WindowConfig.DEFAULT_WIDTH, height=WindowConfig.DEFAULT_HEIGHT):
@@ -25,12 +32,22 @@ class Renderer:
         # Initialize event handler
         self.event_handler = EventHandler(circuit)
         self.event_handler.on_quit = self._on_quit
+        self.event_handler.on_circuit_change = self._on_circuit_change
         
         # Initialize renderers
         self.grid_renderer = GridRenderer(self.screen, circuit)
         self.component_renderer = ComponentRenderer(self.screen, circuit, self.grid_renderer)
 
+        # Grid and components only change on edits, so they are rendered into
+        # a cached scene surface that is redrawn only when marked dirty
+        self._scene_surface = pygame.Surface((width, height))
+        self._scene_dirty = True
+
         self.tool_buttons = []
+        # Tool the button selection currently reflects
+        self._selected_tool = None
+        # Button currently held down with the left mouse button
+        self._pressed_button = None
         
         self.border = WindowConfig.BORDER
         
@@ -50,33 +67,62 @@ class Renderer:
         
         # Add ui buttons
         for tool in Tool:
-            # Create lambda with tool parameter bound at creation time
-            onclick = lambda t=tool: self._on_add_component(t)
+            # Bind the tool parameter at creation time
+            onclick = partial(self._on_add_component, tool)
             self.tool_buttons.append(Button(
                 (btn_x, btn_y, btn_w, btn_h),
                 tool.name,
-                " ".join(word.capitalize() for word in tool.name.split("_")),
+                TOOL_DISPLAY[tool],
                 on_click=onclick,
                 selected=tool.value == "WIRE"  # Wire is the default tool
             ))
             btn_x += btn_w + spacing
+
+        # Button hit boxes, and the screen area covered by the whole toolbar
+        # (used for click hit tests and partial display updates)
+        self._button_rects = [(button.rect, button) for button in self.tool_buttons]
+        first, *rest = self.tool_buttons
+        self._toolbar_rect = first.rect.unionall([button.rect for button in rest])
         
         # Update button states to match default tool
         self._update_tool_buttons()
 
     def _handle_ui_events(self, event):
         """Handle UI-related events."""
-        try:
-            for button in self.tool_buttons:
+        if event.type not in _UI_EVENT_TYPES or event.button != pygame.BUTTON_LEFT:
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Only the button under the cursor can be pressed
+            button = self._button_at(event.pos)
+            if self._pressed_button is not None and self._pressed_button is not button:
+                self._pressed_button.pressed = False
+            self._pressed_button = button
+            if button is not None:
                 button.handle_event(event)
-
-        except Exception as e:
-            print(f"Error handling UI event: {e}")
+        elif self._pressed_button is not None:
+            # Only the pressed button can complete a click; it checks the
+            # release position itself
+            self._pressed_button.handle_event(event)
+            self._pressed_button = None
+
+    def _button_at(self, pos):
+        """Return the tool button containing pos, or None."""
+        if not self._toolbar_rect.collidepoint(pos):
+            return None
+        for rect, button in self._button_rects:
+            if rect.collidepoint(pos):
+                return button
+        return None
 
     def _update_tool_buttons(self):
         """Update button states to match current tool."""
         current_tool = self.event_handler.current_tool
-        print(current_tool)
+        if current_tool is self._selected_tool:
+            return
+        self._selected_tool = current_tool
+
+        logger.debug("Current tool: %s", current_tool)
         for button in self.tool_buttons:
             button.set_selected(current_tool.name == button.button_id)
 
@@ -90,50 +136,99 @@ class Renderer:
         """Handle quit event."""
         self.running = False
 
-    def handle_events(self):
-        """Process all pending events."""
-        for event in pygame.event.get():
+    def _on_circuit_change(self):
+        """Callback when a component is placed or removed."""
+        self._scene_dirty = True
+
+    def _render_scene(self):
+        """Redraw the grid and components into the cached scene surface."""
+        self._scene_surface.fill(Colors.WHITE)
+        self.grid_renderer.draw(self._scene_surface)
+        self.component_renderer.draw(self._scene_surface)
+        self._scene_dirty = False
+
+    def handle_events(self, events=None):
+        """Process a batch of events (drains the pygame queue if none given)."""
+        if events is None:
+            events = pygame.event.get()
+
+        handle_ui_events = self._handle_ui_events
+        handle_event = self.event_handler.handle_event
+        pixel_to_grid = self.grid_renderer.pixel_to_grid
+        border = self.border
+
+        last = len(events) - 1
+        for i, event in enumerate(events):
+            # Coalesce runs of motion events: only the latest position matters,
+            # and keeping the last of each run preserves order with clicks
+            if (event.type == pygame.MOUSEMOTION and i < last
+                    and events[i + 1].type == pygame.MOUSEMOTION):
+                continue
+
             # Handle UI events first
-            self._handle_ui_events(event)
+            handle_ui_events(event)
 
             # Get grid coordinates if it's a mouse event
             grid_coords = None
-            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-                if event.pos[0] > self.border and event.pos[1] > self.border:
-                    grid_coords = self.grid_renderer.pixel_to_grid(event.pos[0], event.pos[1])
+            if event.type in _MOUSE_EVENT_TYPES:
+                x, y = event.pos
+                if x > border and y > border:
+                    grid_coords = pixel_to_grid(x, y)
 
             # Let event handler process the event
-            self.event_handler.handle_event(event, grid_coords)
+            handle_event(event, grid_coords)
 
-    def _update_ui(self):
+    def _update_ui(self, mouse_pos):
         """Update and draw UI elements."""
-        try:
-            mouse_pos = pygame.mouse.get_pos()
-
-            for button in self.tool_buttons:
-                button.update(mouse_pos)
-                button.draw(self.screen)
-
-        except Exception as e:
-            print(f"Error updating UI: {e}")
+        for button in self.tool_buttons:
+            button.update(mouse_pos)
+            button.draw(self.screen)
 
     def update(self):
         """Update and render the game state."""
         # Maintain frame rate
         self.clock.tick(self.fps)
-        
-        # Clear screen
-        self.screen.fill(Colors.WHITE)
-        
-        # Draw circuit elements
-        self.grid_renderer.draw()
-        self.component_renderer.draw()
+
+        # Drain the event queue once per frame
+        events = pygame.event.get()
+
+        # When idle, park the thread in SDL until input arrives instead of
+        # spinning, then drain whatever queued up behind the woken event
+        if not events and not self._scene_dirty:
+            event = pygame.event.wait(WindowConfig.IDLE_WAIT_MS)
+            if event.type != pygame.NOEVENT:
+                events = [event]
+                events.extend(pygame.event.get())
+
+        # Sample the mouse once per frame
+        mouse_pos = pygame.mouse.get_pos()
+
+        # Process events before drawing so edits show up this frame
+        self.handle_events(events)
+
+        # Everything on screen only changes in response to input or edits,
+        # so an idle frame has nothing to redraw
+        if not events and not self._scene_dirty:
+            return
+
+        # Draw circuit elements, re-rendering the scene only after edits.
+        # Without an edit only the toolbar can change, so just restore and
+        # present that area, unless the window itself needs repainting
+        full_redraw = self._scene_dirty or any(
+            event.type in _REPAINT_EVENT_TYPES for event in events)
+        if full_redraw:
+            if self._scene_dirty:
+                self._render_scene()
+            self.screen.blit(self._scene_surface, (0, 0))
+        else:
+            toolbar = self._toolbar_rect
+            self.screen.blit(self._scene_surface, toolbar, toolbar)
         
         # Update UI
-        self._update_ui()
+        self._update_ui(mouse_pos)
         
         # Refresh display
-        pygame.display.flip()
-        
-        # Process events
-        self.handle_events()
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._toolbar_rect)